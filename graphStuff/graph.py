@@ -5,16 +5,16 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class SongNode:
     song_id: str
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TransitionEdge:
     source: str  # song_id
     target: str  # song_id
@@ -30,6 +30,9 @@ class DirectedSongGraph:
         self.edges: Dict[
             str, List[TransitionEdge]
         ] = {}  # source song_id -> list of edges
+        self.edges_by_pair: Dict[
+            Tuple[str, str], List[TransitionEdge]
+        ] = {}  # (source, target) -> list of edges
 
     def add_song(self, song_id: str, metadata: Optional[dict] = None):
         if song_id not in self.nodes:
@@ -50,6 +53,7 @@ class DirectedSongGraph:
         if source not in self.edges:
             self.edges[source] = []
         self.edges[source].append(edge)
+        self.edges_by_pair.setdefault((source, target), []).append(edge)
         # Ensure both nodes exist
         self.add_song(source)
         self.add_song(target)
@@ -62,6 +66,10 @@ class DirectedSongGraph:
         """Return all outgoing TransitionEdge objects from this song."""
         return self.edges.get(song_id, [])
 
+    def get_edges_between(self, source: str, target: str) -> List[TransitionEdge]:
+        """Return all TransitionEdge objects from source to target."""
+        return self.edges_by_pair.get((source, target), [])
+
     def get_song(self, song_id: str) -> Optional[SongNode]:
         return self.nodes.get(song_id)
 
@@ -73,3 +81,4 @@ class DirectedSongGraph:
 # graph.add_transition('song1', 'song2', datetime.now(), 'mix123', 0.95)
 # neighbors = graph.get_neighbors('song1')
 # out_edges = graph.get_out_edges('song1')
+# pair_edges = graph.get_edges_between('song1', 'song2')